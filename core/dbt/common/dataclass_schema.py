@@ -80,10 +80,16 @@ class dbtClassMixin(DataClassDictMixin):
         json_schema = json_schema_obj.to_dict()
         return json_schema
 
+    # Reusing the validator lets jsonschema keep its resolved $refs between
+    # calls, which matters when the same contract is validated per node.
+    @classmethod
+    @functools.lru_cache
+    def _json_schema_validator(cls) -> jsonschema.Draft7Validator:
+        return jsonschema.Draft7Validator(cls.json_schema())
+
     @classmethod
     def validate(cls, data):
-        json_schema = cls.json_schema()
-        validator = jsonschema.Draft7Validator(json_schema)
+        validator = cls._json_schema_validator()
         error = next(iter(validator.iter_errors(data)), None)
         if error is not None:
             raise ValidationError.create_from(error) from error
@@ -30,10 +30,12 @@ from dbt.exceptions import ParsingError
 
 from dbt_semantic_interfaces.type_enums import ConversionCalculationType
 
-from dataclasses import dataclass, field
-from datetime import timedelta
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional, List, Union, Dict, Any, Sequence, Literal
+from typing import Optional, List, Union, Dict, Any, Sequence, Literal, Tuple
+
+# names may only contain alphanumeric chars, underscores and hyphens
+_VALID_NAME_RE = re.compile(r"[\w-]+$")
 
 
 @dataclass
@@ -279,6 +281,13 @@ class TimePeriod(StrEnum):
         return str(self) + "s"
 
 
+_PERIOD_SECONDS: Dict[TimePeriod, int] = {
+    TimePeriod.minute: 60,
+    TimePeriod.hour: 60 * 60,
+    TimePeriod.day: 24 * 60 * 60,
+}
+
+
 @dataclass
 class Time(dbtClassMixin, Mergeable):
     count: Optional[int] = None
@@ -287,9 +296,7 @@ class Time(dbtClassMixin, Mergeable):
     def exceeded(self, actual_age: float) -> bool:
         if self.period is None or self.count is None:
             return False
-        kwargs: Dict[str, int] = {self.period.plural(): self.count}
-        difference = timedelta(**kwargs).total_seconds()
-        return actual_age > difference
+        return actual_age > self.count * _PERIOD_SECONDS[self.period]
 
     def __bool__(self):
         return self.count is not None and self.period is not None
@@ -304,9 +311,11 @@ class FreshnessThreshold(dbtClassMixin, Mergeable):
     def status(self, age: float) -> "dbt.contracts.results.FreshnessStatus":
         from dbt.contracts.results import FreshnessStatus
 
-        if self.error_after and self.error_after.exceeded(age):
+        # Time.exceeded is False for an unset threshold, so no bool() check is needed
+        error_after, warn_after = self.error_after, self.warn_after
+        if error_after is not None and error_after.exceeded(age):
             return FreshnessStatus.Error
-        elif self.warn_after and self.warn_after.exceeded(age):
+        elif warn_after is not None and warn_after.exceeded(age):
             return FreshnessStatus.Warn
         else:
             return FreshnessStatus.Pass
@@ -407,11 +416,7 @@ class SourceTablePatch(dbtClassMixin):
     columns: Optional[Sequence[UnparsedColumn]] = None
 
     def to_patch_dict(self) -> Dict[str, Any]:
-        dct = self.to_dict(omit_none=True)
-        remove_keys = "name"
-        for key in remove_keys:
-            if key in dct:
-                del dct[key]
+        dct = _to_patch_dict(self, _SOURCE_TABLE_PATCH_FIELDS)
 
         if self.freshness is None:
             dct["freshness"] = None
@@ -442,12 +447,14 @@ class SourcePatch(dbtClassMixin, Replaceable):
     tables: Optional[List[SourceTablePatch]] = None
     tags: Optional[List[str]] = None
 
+    def __post_init__(self) -> None:
+        # keep the first table for each name, matching the old linear scan
+        self._table_map: Dict[str, SourceTablePatch] = {}
+        for table in self.tables or []:
+            self._table_map.setdefault(table.name, table)
+
     def to_patch_dict(self) -> Dict[str, Any]:
-        dct = self.to_dict(omit_none=True)
-        remove_keys = ("name", "overrides", "tables", "path")
-        for key in remove_keys:
-            if key in dct:
-                del dct[key]
+        dct = _to_patch_dict(self, _SOURCE_PATCH_FIELDS)
 
         if self.freshness is None:
             dct["freshness"] = None
@@ -455,11 +462,40 @@ class SourcePatch(dbtClassMixin, Replaceable):
         return dct
 
     def get_table_named(self, name: str) -> Optional[SourceTablePatch]:
-        if self.tables is not None:
-            for table in self.tables:
-                if table.name == name:
-                    return table
-        return None
+        return self._table_map.get(name)
+
+
+def _patch_fields(cls, remove_keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls) if f.name not in remove_keys)
+
+
+_SOURCE_TABLE_PATCH_FIELDS = _patch_fields(SourceTablePatch, ("name",))
+_SOURCE_PATCH_FIELDS = _patch_fields(SourcePatch, ("name", "overrides", "tables", "path"))
+
+
+def _to_patch_dict(patch: dbtClassMixin, field_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Serialize the set fields of a source patch.
+
+    This produces the same dict as `to_dict(omit_none=True)` restricted to
+    `field_names`, but only sends the nested contracts through mashumaro
+    instead of serializing the whole patch and then deleting keys.
+    """
+    dct: Dict[str, Any] = {}
+    for name in field_names:
+        value = getattr(patch, name)
+        if value is None:
+            continue
+        if isinstance(value, dbtClassMixin):
+            value = value.to_dict(omit_none=True)
+        elif isinstance(value, (list, tuple)):
+            value = [
+                item.to_dict(omit_none=True) if isinstance(item, dbtClassMixin) else item
+                for item in value
+            ]
+        elif isinstance(value, dict):
+            value = dict(value)
+        dct[name] = value
+    return dct
 
 
 @dataclass
@@ -492,8 +528,7 @@ class Maturity(StrEnum):
     def __lt__(self, other):
         if not isinstance(other, Maturity):
             return NotImplemented
-        order = (Maturity.low, Maturity.medium, Maturity.high)
-        return order.index(self) < order.index(other)
+        return _MATURITY_ORDER[self] < _MATURITY_ORDER[other]
 
     def __gt__(self, other):
         if not isinstance(other, Maturity):
@@ -511,6 +546,9 @@ class Maturity(StrEnum):
         return self == other or self < other
 
 
+_MATURITY_ORDER = {Maturity.low: 0, Maturity.medium: 1, Maturity.high: 2}
+
+
 class ExposureType(StrEnum):
     Dashboard = "dashboard"
     Notebook = "notebook"
@@ -550,7 +588,7 @@ class UnparsedExposure(dbtClassMixin, Replaceable):
         super(UnparsedExposure, cls).validate(data)
         if "name" in data:
             # name can only contain alphanumeric chars and underscores
-            if not (re.match(r"[\w-]+$", data["name"])):
+            if not _VALID_NAME_RE.match(data["name"]):
                 deprecations.warn("exposure-name", exposure=data["name"])
 
         if data["owner"].get("name") is None and data["owner"].get("email") is None:
@@ -649,21 +687,23 @@ class UnparsedMetric(dbtClassMixin):
     def validate(cls, data):
         super(UnparsedMetric, cls).validate(data)
         if "name" in data:
+            name = data["name"]
             errors = []
-            if " " in data["name"]:
+            if " " in name:
                 errors.append("cannot contain spaces")
             # This handles failing queries due to too long metric names.
             # It only occurs in BigQuery and Snowflake (Postgres/Redshift truncate)
-            if len(data["name"]) > 250:
+            if len(name) > 250:
                 errors.append("cannot contain more than 250 characters")
-            if not (re.match(r"^[A-Za-z]", data["name"])):
+            first_char = name[:1]
+            if not (first_char.isascii() and first_char.isalpha()):
                 errors.append("must begin with a letter")
-            if not (re.match(r"[\w-]+$", data["name"])):
+            if not _VALID_NAME_RE.match(name):
                 errors.append("must contain only letters, numbers and underscores")
 
             if errors:
                 raise ParsingError(
-                    f"The metric name '{data['name']}' is invalid.  It {', '.join(e for e in errors)}"
+                    f"The metric name '{name}' is invalid.  It {', '.join(e for e in errors)}"
                 )
 
 
@@ -5,6 +5,9 @@ from dbt.adapters.base.relation import BaseRelation
 from dbt.adapters.postgres.relation import PostgresRelation
 
 
+_INDEX_HEADERS = ("name", "method", "unique", "column_names")
+
+
 def query_relation_type(project, relation: BaseRelation) -> Optional[str]:
     assert isinstance(relation, PostgresRelation)
     sql = f"""
@@ -63,11 +66,5 @@ def query_indexes(project, relation: BaseRelation) -> List[Dict[str, str]]:
         order by 1, 2, 3
     """
     raw_indexes = project.run_sql(sql, fetch="all")
-    indexes = [
-        {
-            header: value
-            for header, value in zip(["name", "method", "unique", "column_names"], index)
-        }
-        for index in raw_indexes
-    ]
+    indexes = [dict(zip(_INDEX_HEADERS, index)) for index in raw_indexes]
     return indexes
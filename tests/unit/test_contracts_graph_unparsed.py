@@ -12,12 +12,15 @@ from dbt.contracts.graph.unparsed import (
     Quoting,
     UnparsedSourceDefinition,
     UnparsedSourceTableDefinition,
+    SourcePatch,
+    SourceTablePatch,
     UnparsedDocumentationFile,
     UnparsedColumn,
     UnparsedNodeUpdate,
     UnparsedModelUpdate,
     Docs,
     UnparsedExposure,
+    Maturity,
     MaturityType,
     Owner,
     ExposureType,
@@ -347,6 +350,71 @@ class TestUnparsedSourceDefinition(ContractTestCase):
         pickle.loads(pickle.dumps(source))
 
 
+class TestSourcePatch(ContractTestCase):
+    ContractType = SourcePatch
+
+    def get_ok_dict(self):
+        return {
+            "name": "my_source",
+            "overrides": "other_package",
+            "path": "models/sources.yml",
+            "config": {"enabled": False},
+            "loader": "some_loader",
+            "quoting": {"database": False},
+            "freshness": {"warn_after": {"count": 1, "period": "hour"}},
+            "tables": [{"name": "my_table", "description": "my table"}],
+            "tags": ["my_tag"],
+        }
+
+    def test_to_patch_dict(self):
+        patch = self.ContractType.from_dict(self.get_ok_dict())
+        self.assertEqual(
+            patch.to_patch_dict(),
+            {
+                "config": {"enabled": False},
+                "loader": "some_loader",
+                "quoting": {"database": False},
+                "freshness": {"warn_after": {"count": 1, "period": "hour"}, "error_after": {}},
+                "tags": ["my_tag"],
+            },
+        )
+
+    def test_to_patch_dict_no_freshness(self):
+        dct = self.get_ok_dict()
+        dct["freshness"] = None
+        patch = self.ContractType.from_dict(dct)
+        self.assertIsNone(patch.to_patch_dict()["freshness"])
+
+    def test_table_to_patch_dict_tuple_columns(self):
+        table_patch = SourceTablePatch(
+            name="my_table", columns=(UnparsedColumn(name="my_column"),)
+        )
+        self.assertEqual(
+            table_patch.to_patch_dict()["columns"],
+            table_patch.to_dict(omit_none=True)["columns"],
+        )
+        self.assertIsInstance(table_patch.to_patch_dict()["columns"], list)
+
+    def test_get_table_named(self):
+        patch = self.ContractType.from_dict(self.get_ok_dict())
+        self.assertEqual(patch.get_table_named("my_table"), patch.tables[0])
+        self.assertIsNone(patch.get_table_named("other_table"))
+        self.assertIsNone(patch.replace(tables=None).get_table_named("my_table"))
+
+    def test_table_to_patch_dict(self):
+        patch = self.ContractType.from_dict(self.get_ok_dict())
+        table_patch = patch.get_table_named("my_table")
+        self.assertIsInstance(table_patch, SourceTablePatch)
+        self.assertEqual(
+            table_patch.to_patch_dict(),
+            {
+                "description": "my table",
+                "quoting": {},
+                "freshness": {"warn_after": {}, "error_after": {}},
+            },
+        )
+
+
 class TestUnparsedDocumentationFile(ContractTestCase):
     ContractType = UnparsedDocumentationFile
 
@@ -952,3 +1020,18 @@ class TestUnparsedVersion(ContractTestCase):
 )
 def test_unparsed_version_lt(left, right, expected_lt):
     assert (UnparsedVersion(left) < UnparsedVersion(right)) == expected_lt
+
+
+@pytest.mark.parametrize(
+    "left,right,expected_lt",
+    [
+        (Maturity.low, Maturity.medium, True),
+        (Maturity.low, Maturity.high, True),
+        (Maturity.medium, Maturity.high, True),
+        (Maturity.high, Maturity.low, False),
+        (Maturity.medium, Maturity.medium, False),
+    ],
+)
+def test_maturity_lt(left, right, expected_lt):
+    assert (left < right) == expected_lt
+    assert (left >= right) == (not expected_lt)